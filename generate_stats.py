@@ -4,21 +4,15 @@ Generate detailed statistics from scraped threads.
 Creates a comprehensive README section with per-thread details.
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, List, Any
 from collections import defaultdict
 
+# Add src to path to import the package
+sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-def load_thread_metadata(thread_dir: Path) -> Dict[str, Any]:
-    """Load metadata.json from a thread directory."""
-    metadata_file = thread_dir / "metadata.json"
-    if not metadata_file.exists():
-        return None
-
-    with open(metadata_file, 'r') as f:
-        return json.load(f)
+from ma2_forums_miner.utils import load_all_thread_metadata
 
 
 def get_file_size_str(size_bytes: int) -> str:
@@ -41,8 +35,9 @@ def analyze_threads() -> Dict[str, Any]:
         print("❌ No output/threads directory found")
         return None
 
-    thread_dirs = sorted([d for d in output_dir.iterdir() if d.is_dir()])
-    print(f"📊 Analyzing {len(thread_dirs)} threads...")
+    # Loads every metadata.json concurrently, sorted by thread folder
+    thread_metadata = load_all_thread_metadata(output_dir)
+    print(f"📊 Analyzing {len(thread_metadata)} threads...")
 
     stats = {
         'total_threads': 0,
@@ -57,8 +52,7 @@ def analyze_threads() -> Dict[str, Any]:
         'newest_thread_id': 0,
     }
 
-    for thread_dir in thread_dirs:
-        metadata = load_thread_metadata(thread_dir)
+    for thread_dir, metadata in thread_metadata:
         if not metadata:
             continue
 
@@ -94,21 +88,23 @@ def analyze_threads() -> Dict[str, Any]:
                 ext = Path(filename).suffix.lower()
                 stats['file_types'][ext] += 1
 
-                # Check if file actually exists
+                # Check if file actually exists (one stat() gives both
+                # existence and size, instead of exists() followed by stat())
                 file_path = thread_dir / filename
-                if file_path.exists():
+                try:
                     size = file_path.stat().st_size
-                    stats['total_size'] += size
+                except (FileNotFoundError, NotADirectoryError):
                     actual_files.append({
                         'filename': filename,
-                        'size': size,
-                        'exists': True
+                        'size': asset.get('size'),
+                        'exists': False
                     })
                 else:
+                    stats['total_size'] += size
                     actual_files.append({
                         'filename': filename,
-                        'size': asset.get('size'),
-                        'exists': False
+                        'size': size,
+                        'exists': True
                     })
 
         # Extract year from post_date
@@ -8,6 +8,7 @@ setup(
     install_requires=[
         "httpx[http2]>=0.25.0",
         "beautifulsoup4>=4.12.0",
+        "soupsieve>=2.4",
         "lxml>=5.0.0",
         "tqdm>=4.66.0",
         "orjson>=3.9.0",
@@ -20,7 +20,12 @@ Usage:
 
 from .models import Asset, ThreadMetadata
 from .scraper import ForumScraper
-from .utils import sha256_file, safe_thread_folder
+from .utils import (
+    load_all_thread_metadata,
+    load_thread_metadata,
+    safe_thread_folder,
+    sha256_file,
+)
 
 __all__ = [
     'ForumScraper',
@@ -28,6 +33,8 @@ __all__ = [
     'Asset',
     'sha256_file',
     'safe_thread_folder',
+    'load_thread_metadata',
+    'load_all_thread_metadata',
 ]
 
 __version__ = '1.0.0'
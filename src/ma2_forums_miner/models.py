@@ -5,7 +5,7 @@ This module defines typed data structures for representing scraped forum data.
 Using dataclasses provides clear structure, type hints, and easy JSON serialization.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
@@ -35,7 +35,14 @@ class Post:
 
     def to_dict(self) -> dict:
         """Convert the post to a dictionary for JSON serialization."""
-        return asdict(self)
+        # Built explicitly rather than with asdict(), which deep-copies
+        # every field value - all fields here are immutable anyway
+        return {
+            'author': self.author,
+            'post_date': self.post_date,
+            'post_text': self.post_text,
+            'post_number': self.post_number,
+        }
 
 
 @dataclass
@@ -77,7 +84,14 @@ class Asset:
         Returns:
             Dictionary representation of the asset with all fields.
         """
-        return asdict(self)
+        return {
+            'filename': self.filename,
+            'url': self.url,
+            'size': self.size,
+            'download_count': self.download_count,
+            'checksum': self.checksum,
+            'post_number': self.post_number,
+        }
 
 
 @dataclass
@@ -141,11 +155,26 @@ class ThreadMetadata:
         """
         Convert the thread metadata to a dictionary for JSON serialization.
         
-        This recursively converts the ThreadMetadata and all nested Asset
+        This converts the ThreadMetadata and all nested Post and Asset
         objects into plain dictionaries that can be written to JSON.
         
         Returns:
             Dictionary representation with all fields serialized.
+            
+        Why not dataclasses.asdict()?
+            asdict() recurses through every field with copy.deepcopy(),
+            which is slow for threads with many posts. Each nested object
+            builds its own dict instead; the output is identical.
         """
-        # asdict() automatically handles nested dataclasses recursively
-        return asdict(self)
+        return {
+            'thread_id': self.thread_id,
+            'title': self.title,
+            'url': self.url,
+            'author': self.author,
+            'post_date': self.post_date,
+            'post_text': self.post_text,
+            'posts': [post.to_dict() for post in self.posts],
+            'replies': self.replies,
+            'views': self.views,
+            'assets': [asset.to_dict() for asset in self.assets],
+        }
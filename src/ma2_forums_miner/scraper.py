@@ -12,22 +12,25 @@ Target: https://forum.malighting.com/forum/board/35-grandma2-macro-share/
 """
 
 import asyncio
+import hashlib
 import json
 import re
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import httpx
 import orjson
+import soupsieve
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from .models import Asset, Post, ThreadMetadata
-from .utils import sha256_file, safe_thread_folder
+from .utils import safe_thread_folder
 
 
 @dataclass
@@ -44,6 +47,30 @@ class ThreadInfo:
     date: Optional[str] = None
 
 
+def sort_threads_by_date(threads: List[ThreadInfo]) -> List[ThreadInfo]:
+    """
+    Sort threads by date (oldest first), with undated threads at the end.
+    
+    Args:
+        threads: ThreadInfo objects to sort
+        
+    Returns:
+        A new sorted list; threads without a date keep their relative order
+        
+    How this works:
+        The forum uses ISO 8601 formatted datetime strings
+        (YYYY-MM-DDTHH:MM:SSZ), which sort correctly alphabetically, so no
+        date parsing is needed. Dated threads are sorted with an
+        attrgetter key (evaluated in C, no Python lambda call per thread)
+        and undated threads are appended afterwards. This is equivalent to
+        sorting with a "9999-99-99" sentinel for missing dates.
+    """
+    dated = [t for t in threads if t.date]
+    undated = [t for t in threads if not t.date]
+    dated.sort(key=attrgetter('date'))
+    return dated + undated
+
+
 # -------------------------------------------------------
 # CONSTANTS
 # -------------------------------------------------------
@@ -64,11 +91,114 @@ BOARD_URL = f"{BASE_URL}/forum/board/35-grandma2-macro-share/"
 MAX_CONCURRENT_REQUESTS = 8  # Number of simultaneous HTTP requests
 REQUEST_DELAY = 1.5  # Seconds to wait between requests (be respectful!)
 REQUEST_TIMEOUT = 30.0  # Seconds before timing out a request
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per chunk when streaming asset downloads
+
+# Attachment file extensions worth downloading (compared without the dot)
+ASSET_EXTENSIONS = frozenset({'xml', 'zip', 'gz', 'show'})
 
 # Exponential backoff settings for rate limit handling
 MAX_RETRIES = 5  # Maximum number of retry attempts
 INITIAL_BACKOFF = 2  # Initial backoff delay in seconds (doubles each retry)
 
+# Precompiled regular expressions
+# These run for every link, page and thread, so compile them once at import
+# instead of going through re's pattern cache on every call
+PAGE_PATH_RE = re.compile(r'/page/(\d+)/')  # /page/N/ pagination links
+PAGE_NO_RE = re.compile(r'[?&]pageNo=(\d+)')  # ?pageNo=N pagination links
+PAGE_OF_RE = re.compile(r'Page \d+ of (\d+)', re.IGNORECASE)  # "Page X of Y" text
+THREAD_ID_RE = re.compile(r'/thread/(\d+)-')  # .../thread/30890-title-slug/
+REPLIES_RE = re.compile(r'(\d+)\s*(?:replies|antworten)', re.I)
+VIEWS_RE = re.compile(r'(\d+)\s*(?:views|ansichten)', re.I)
+DOWNLOADS_RE = re.compile(r'(\d[\d.,]*)\s+Downloads?', re.I)  # "5.07 kB – 1,234 Downloads"
+
+# Precompiled CSS selectors
+# soup.select('...') re-parses the selector string on every call; compiling
+# with soupsieve once and calling .select(tag) / .select_one(tag) skips that
+SEL_THREAD_CONTAINERS = soupsieve.compile('li.wbbThread, tr.wbbThread, div.threadBit, article.thread')
+SEL_TOPIC_LINK = soupsieve.compile('a.wbbTopicLink')
+SEL_TIME = soupsieve.compile('time')
+SEL_PAGINATION_LINKS = soupsieve.compile('.pageNavigation a')
+SEL_THREAD_TITLE = soupsieve.compile('h1.topic-title, .contentTitle')
+SEL_STATS = soupsieve.compile('.stats')
+SEL_POSTS = soupsieve.compile('article.message')
+SEL_USERNAME = soupsieve.compile('.username')
+SEL_POST_CONTENT = soupsieve.compile('.messageContent, .messageText')
+SEL_ATTACHMENT_LINKS = soupsieve.compile('a.messageAttachment, a.attachment, a[class*="attachment"], a[href*="file-download"]')
+SEL_ATTACHMENT_FILENAME = soupsieve.compile('span.messageAttachmentFilename')
+SEL_ATTACHMENT_META = soupsieve.compile('span.messageAttachmentMeta')
+
+# Use realistic browser headers to avoid bot detection
+# These headers mimic a real Chrome browser on Windows
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+
+def create_client(max_connections: int = MAX_CONCURRENT_REQUESTS) -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client used for all forum requests.
+    
+    Page fetches and asset downloads all go to the same origin, so a
+    single client lets them share one connection pool instead of each
+    paying for its own TCP + TLS handshakes.
+    
+    Args:
+        max_connections: Size of the connection pool (defaults to the
+                         scraper's concurrency limit)
+    
+    Returns:
+        An httpx.AsyncClient - the caller is responsible for closing it
+        
+    Why HTTP/2?
+        - Multiple requests over single TCP connection
+        - Header compression reduces bandwidth
+        - Server push capability (though we don't use it here)
+        - Better performance for multiple concurrent requests
+    """
+    return httpx.AsyncClient(
+        http2=True,  # Enable HTTP/2
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        ),
+        headers=DEFAULT_HEADERS
+    )
+
+
+def parse_download_count(meta_text: str) -> Optional[int]:
+    """
+    Parse the download count out of an attachment's metadata text.
+    
+    Args:
+        meta_text: Text of the span.messageAttachmentMeta element,
+                   e.g. "5.07 kB – 317 Downloads"
+        
+    Returns:
+        The download count, or None if the text has no count
+        
+    Why strip both "," and "."?
+        The English forum writes thousands as "1,234" while the German
+        one writes "1.234". A count is always a whole number, so either
+        character can only be a thousands separator here.
+    """
+    downloads_match = DOWNLOADS_RE.search(meta_text)
+    if not downloads_match:
+        return None
+    return int(downloads_match.group(1).replace(',', '').replace('.', ''))
+
 
 class ForumScraper:
     """
@@ -93,7 +223,8 @@ class ForumScraper:
         output_dir: Path = OUTPUT_DIR,
         manifest_file: Path = MANIFEST_FILE,
         max_concurrent: int = MAX_CONCURRENT_REQUESTS,
-        request_delay: float = REQUEST_DELAY
+        request_delay: float = REQUEST_DELAY,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize the forum scraper.
@@ -103,6 +234,8 @@ class ForumScraper:
             manifest_file: Path to manifest JSON file
             max_concurrent: Maximum concurrent HTTP requests
             request_delay: Delay between requests in seconds
+            client: Optional shared HTTP client (see create_client).
+                    If omitted, run() creates and closes its own.
         """
         self.output_dir = output_dir
         self.manifest_file = manifest_file
@@ -125,8 +258,8 @@ class ForumScraper:
         # Visited threads tracking (loaded from manifest)
         self.visited_urls: Set[str] = set()
         
-        # HTTP client (initialized in run())
-        self.client: Optional[httpx.AsyncClient] = None
+        # HTTP client (injected, or initialized in run())
+        self.client: Optional[httpx.AsyncClient] = client
     
     # -------------------------------------------------------
     # MANIFEST MANAGEMENT
@@ -182,7 +315,8 @@ class ForumScraper:
         """
         try:
             # Convert set to sorted list for consistent output
-            data = sorted(list(self.visited_urls))
+            # (sorted() already returns a new list - no intermediate copy needed)
+            data = sorted(self.visited_urls)
             
             # orjson.dumps() produces bytes, write directly
             # option=orjson.OPT_INDENT_2 makes the file human-readable
@@ -386,11 +520,8 @@ class ForumScraper:
         # -------------------------------------------------------
         # STEP 4: Sort by date (oldest first)
         # -------------------------------------------------------
-        # Sort by date using string comparison (works for ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)
-        # The forum uses ISO 8601 formatted datetime strings, which sort correctly alphabetically
         # Threads with no date go to the end
-        thread_list = list(unique_threads.values())
-        thread_list.sort(key=lambda t: t.date if t.date else "9999-99-99")
+        thread_list = sort_threads_by_date(list(unique_threads.values()))
         
         print(f"✅ Discovered {len(thread_list)} unique threads")
         print(f"📅 Sorted by date (oldest first)")
@@ -425,11 +556,11 @@ class ForumScraper:
         
         # Find all thread list items (container for each thread row)
         # Try multiple selectors to find thread containers
-        thread_containers = soup.select('li.wbbThread, tr.wbbThread, div.threadBit, article.thread')
+        thread_containers = SEL_THREAD_CONTAINERS.select(soup)
         
         if not thread_containers:
             # Fallback: Find all thread links and try to find dates nearby
-            thread_links = soup.select('a.wbbTopicLink')
+            thread_links = SEL_TOPIC_LINK.select(soup)
             for link in thread_links:
                 href = link.get('href')
                 if href:
@@ -440,7 +571,7 @@ class ForumScraper:
                     # Look for <time> element in parent or nearby siblings
                     parent = link.parent
                     if parent:
-                        time_elem = parent.select_one('time')
+                        time_elem = SEL_TIME.select_one(parent)
                         if time_elem and time_elem.get('datetime'):
                             date = time_elem['datetime']
                     
@@ -449,7 +580,7 @@ class ForumScraper:
             # Extract from containers
             for container in thread_containers:
                 # Extract URL
-                link_elem = container.select_one('a.wbbTopicLink')
+                link_elem = SEL_TOPIC_LINK.select_one(container)
                 if not link_elem:
                     continue
                     
@@ -461,7 +592,7 @@ class ForumScraper:
                 
                 # Extract date
                 date = None
-                time_elem = container.select_one('time')
+                time_elem = SEL_TIME.select_one(container)
                 if time_elem and time_elem.get('datetime'):
                     date = time_elem['datetime']
                 
@@ -490,7 +621,7 @@ class ForumScraper:
         
         # Find all thread link elements
         # CSS selector targets: <a class="wbbTopicLink">
-        thread_elements = soup.select('a.wbbTopicLink')
+        thread_elements = SEL_TOPIC_LINK.select(soup)
         
         for element in thread_elements:
             href = element.get('href')
@@ -526,14 +657,14 @@ class ForumScraper:
         found_pages = []
 
         # Method 1: Standard pagination navigation
-        pagination_links = soup.select('.pageNavigation a')
+        pagination_links = SEL_PAGINATION_LINKS.select(soup)
         if pagination_links:
             print(f"   📄 Method 1: Found {len(pagination_links)} .pageNavigation links")
 
         for link in pagination_links:
             href = link.get('href', '')
             # Try both URL formats: /page/N/ and ?pageNo=N
-            match = re.search(r'/page/(\d+)/', href) or re.search(r'[?&]pageNo=(\d+)', href)
+            match = PAGE_PATH_RE.search(href) or PAGE_NO_RE.search(href)
             if match:
                 page_num = int(match.group(1))
                 found_pages.append(page_num)
@@ -553,7 +684,7 @@ class ForumScraper:
             for link in page_pattern_links:
                 href = link.get('href', '')
                 # Try both URL formats: /page/N/ and ?pageNo=N
-                match = re.search(r'/page/(\d+)/', href) or re.search(r'[?&]pageNo=(\d+)', href)
+                match = PAGE_PATH_RE.search(href) or PAGE_NO_RE.search(href)
                 if match:
                     page_num = int(match.group(1))
                     found_pages.append(page_num)
@@ -562,9 +693,10 @@ class ForumScraper:
         # Method 3: Look for pagination info text (e.g., "Page 1 of 25")
         if max_page == 1:
             # Some forums show "Page X of Y" text
-            page_info = soup.find(string=re.compile(r'Page \d+ of \d+', re.IGNORECASE))
+            # The same precompiled pattern finds the text node and captures Y
+            page_info = soup.find(string=PAGE_OF_RE)
             if page_info:
-                match = re.search(r'of (\d+)', page_info, re.IGNORECASE)
+                match = PAGE_OF_RE.search(page_info)
                 if match:
                     page_num = int(match.group(1))
                     found_pages.append(page_num)
@@ -621,7 +753,7 @@ class ForumScraper:
         # -------------------------------------------------------
         # Thread URLs look like: .../thread/30890-title-slug/
         # We extract the numeric ID
-        thread_id_match = re.search(r'/thread/(\d+)-', url)
+        thread_id_match = THREAD_ID_RE.search(url)
         if not thread_id_match:
             print(f"⚠️  Could not extract thread ID from {url}")
             return None
@@ -630,7 +762,7 @@ class ForumScraper:
         # -------------------------------------------------------
         # Extract thread title
         # -------------------------------------------------------
-        title_elem = soup.select_one('h1.topic-title, .contentTitle')
+        title_elem = SEL_THREAD_TITLE.select_one(soup)
         title = title_elem.text.strip() if title_elem else "Unknown Title"
         
         # -------------------------------------------------------
@@ -656,15 +788,15 @@ class ForumScraper:
         views = 0
         
         # These might be in various places depending on forum layout
-        stats_elem = soup.select_one('.stats')
+        stats_elem = SEL_STATS.select_one(soup)
         if stats_elem:
             stats_text = stats_elem.text
             
-            replies_match = re.search(r'(\d+)\s*(?:replies|antworten)', stats_text, re.I)
+            replies_match = REPLIES_RE.search(stats_text)
             if replies_match:
                 replies = int(replies_match.group(1))
             
-            views_match = re.search(r'(\d+)\s*(?:views|ansichten)', stats_text, re.I)
+            views_match = VIEWS_RE.search(stats_text)
             if views_match:
                 views = int(views_match.group(1))
         
@@ -712,26 +844,26 @@ class ForumScraper:
         posts = []
 
         # Find ALL message/post elements on the page
-        post_elements = soup.select('article.message')
+        post_elements = SEL_POSTS.select(soup)
 
         print(f"    [DEBUG] Found {len(post_elements)} posts in thread")
 
         for idx, post_elem in enumerate(post_elements, start=1):
             # Extract author
             author = "Unknown"
-            author_elem = post_elem.select_one('.username')
+            author_elem = SEL_USERNAME.select_one(post_elem)
             if author_elem:
                 author = author_elem.text.strip()
 
             # Extract post date
             post_date = None
-            time_elem = post_elem.select_one('time')
+            time_elem = SEL_TIME.select_one(post_elem)
             if time_elem and time_elem.get('datetime'):
                 post_date = time_elem['datetime']
 
             # Extract post text content
             post_text = ""
-            content_elem = post_elem.select_one('.messageContent, .messageText')
+            content_elem = SEL_POST_CONTENT.select_one(post_elem)
             if content_elem:
                 post_text = content_elem.get_text(strip=True)
 
@@ -771,11 +903,19 @@ class ForumScraper:
         assets = []
 
         # Find ALL posts on the page to map attachments to post numbers
-        post_elements = soup.select('article.message')
+        post_elements = SEL_POSTS.select(soup)
+
+        # Map every link inside a post to that post's number in one pass,
+        # keyed by element identity. Looking each attachment up here avoids
+        # re-walking every post's links once per attachment.
+        post_number_by_link = {}
+        for idx, post_elem in enumerate(post_elements, start=1):
+            for post_link in post_elem.find_all('a'):
+                post_number_by_link.setdefault(id(post_link), idx)
 
         # Find all attachment links using the actual WoltLab forum structure
         # This searches THE ENTIRE PAGE (all posts, not just first)
-        attachment_links = soup.select('a.messageAttachment, a.attachment, a[class*="attachment"], a[href*="file-download"]')
+        attachment_links = SEL_ATTACHMENT_LINKS.select(soup)
 
         # DEBUG: If no links found, print HTML sample to diagnose
         if len(attachment_links) == 0:
@@ -803,38 +943,30 @@ class ForumScraper:
                 continue
 
             # Determine which post this attachment belongs to
-            post_number = None
-            for idx, post_elem in enumerate(post_elements, start=1):
-                if link in post_elem.find_all('a', recursive=True):
-                    post_number = idx
-                    break
+            post_number = post_number_by_link.get(id(link))
 
             # Extract filename from the span.messageAttachmentFilename child element
-            filename_elem = link.select_one('span.messageAttachmentFilename')
+            filename_elem = SEL_ATTACHMENT_FILENAME.select_one(link)
             if filename_elem:
                 filename = filename_elem.text.strip()
             else:
-                # Fallback to link text or URL
+                # Fallback to link text or the last URL segment (minus any
+                # query string)
                 filename = link.text.strip()
                 if not filename:
-                    filename = href.split('/')[-1]
+                    filename = href.rsplit('/', 1)[-1].split('?', 1)[0]
 
             # Filter by file extensions we care about
-            if any(filename.lower().endswith(ext) for ext in ['.xml', '.zip', '.gz', '.show']):
+            _, dot, extension = filename.rpartition('.')
+            if dot and extension.lower() in ASSET_EXTENSIONS:
                 full_url = urljoin(BASE_URL, href)
 
                 # Optionally extract size and download count from metadata span
                 download_count = None
-                meta_elem = link.select_one('span.messageAttachmentMeta')
+                meta_elem = SEL_ATTACHMENT_META.select_one(link)
                 if meta_elem:
-                    meta_text = meta_elem.text.strip()
-                    # Format: "5.07 kB – 317 Downloads"
-                    if '–' in meta_text and 'Downloads' in meta_text:
-                        try:
-                            downloads_str = meta_text.split('–')[1].strip().split()[0]
-                            download_count = int(downloads_str)
-                        except (IndexError, ValueError):
-                            pass
+                    # Format: "5.07 kB – 317 Downloads" (or "1,234 Downloads")
+                    download_count = parse_download_count(meta_elem.text)
 
                 asset = Asset(
                     filename=filename,
@@ -856,8 +988,8 @@ class ForumScraper:
         Download an asset file and compute its checksum.
         
         This method:
-        1. Downloads the file to the thread's folder
-        2. Computes SHA256 checksum for integrity
+        1. Streams the file to the thread's folder in chunks
+        2. Computes SHA256 checksum for integrity while writing
         3. Updates the asset object with size and checksum
         
         Args:
@@ -874,36 +1006,53 @@ class ForumScraper:
         """
         try:
             async with self.semaphore:
-                response = await self.client.get(
+                # Stream the response instead of buffering the whole file in
+                # memory, then writing it and reading it back to hash it
+                async with self.client.stream(
+                    'GET',
                     asset.url,
                     timeout=REQUEST_TIMEOUT,
                     follow_redirects=True
-                )
-                response.raise_for_status()
-                
-                # -------------------------------------------------------
-                # Save file to disk
-                # -------------------------------------------------------
-                file_path = folder / asset.filename
-                
-                # Handle filename conflicts (unlikely but possible)
-                counter = 1
-                while file_path.exists():
-                    name_parts = asset.filename.rsplit('.', 1)
-                    if len(name_parts) == 2:
-                        new_name = f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                    else:
-                        new_name = f"{asset.filename}_{counter}"
-                    file_path = folder / new_name
-                    counter += 1
-                
-                file_path.write_bytes(response.content)
+                ) as response:
+                    response.raise_for_status()
+                    
+                    # -------------------------------------------------------
+                    # Choose a file path in the thread folder
+                    # -------------------------------------------------------
+                    file_path = folder / asset.filename
+                    
+                    # Handle filename conflicts (unlikely but possible)
+                    counter = 1
+                    while file_path.exists():
+                        name_parts = asset.filename.rsplit('.', 1)
+                        if len(name_parts) == 2:
+                            new_name = f"{name_parts[0]}_{counter}.{name_parts[1]}"
+                        else:
+                            new_name = f"{asset.filename}_{counter}"
+                        file_path = folder / new_name
+                        counter += 1
+                    
+                    # -------------------------------------------------------
+                    # Save file to disk, computing checksum and size as we go
+                    # -------------------------------------------------------
+                    # The file is created before the first await, so concurrent
+                    # downloads of the same filename can't pick the same path
+                    sha256_hash = hashlib.sha256()
+                    size = 0
+                    try:
+                        with open(file_path, "wb") as f:
+                            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                sha256_hash.update(chunk)
+                                size += len(chunk)
+                    except BaseException:
+                        # Don't leave a truncated file behind
+                        file_path.unlink(missing_ok=True)
+                        raise
                 
-                # -------------------------------------------------------
-                # Compute checksum and file size
-                # -------------------------------------------------------
-                asset.checksum = sha256_file(file_path)
-                asset.size = file_path.stat().st_size
+                # Same "sha256:hexdigest" format as sha256_file()
+                asset.checksum = f"sha256:{sha256_hash.hexdigest()}"
+                asset.size = size
                 
                 return True
                 
@@ -1021,33 +1170,12 @@ class ForumScraper:
         # - Connection pooling for efficiency
         # - Proper async/await integration
         #
-        # Why HTTP/2?
-        # - Multiple requests over single TCP connection
-        # - Header compression reduces bandwidth
-        # - Server push capability (though we don't use it here)
-        # - Better performance for multiple concurrent requests
-        print("\n🌐 Initializing HTTP client with HTTP/2 support...")
-        # Use realistic browser headers to avoid bot detection
-        # These headers mimic a real Chrome browser on Windows
-        self.client = httpx.AsyncClient(
-            http2=True,  # Enable HTTP/2
-            timeout=REQUEST_TIMEOUT,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0'
-            }
-        )
+        # An injected client (see create_client) is reused as-is and left
+        # open for its owner; otherwise we create and close our own.
+        owns_client = self.client is None
+        if owns_client:
+            print("\n🌐 Initializing HTTP client with HTTP/2 support...")
+            self.client = create_client(self.max_concurrent)
         
         try:
             # -------------------------------------------------------
@@ -1095,7 +1223,7 @@ class ForumScraper:
             with tqdm(total=len(new_threads), desc="Scraping threads") as pbar:
                 for thread_info in new_threads:
                     # Extract thread ID for display
-                    thread_id_match = re.search(r'/thread/(\d+)-', thread_info.url)
+                    thread_id_match = THREAD_ID_RE.search(thread_info.url)
                     thread_id = thread_id_match.group(1) if thread_id_match else "???"
                     
                     date_str = f" [{thread_info.date[:10]}]" if thread_info.date else ""
@@ -1127,5 +1255,7 @@ class ForumScraper:
             # STEP 7: Clean up HTTP client
             # -------------------------------------------------------
             # Always close the client to free resources, even if
-            # an exception occurred
-            await self.client.aclose()
+            # an exception occurred (only if we created it ourselves)
+            if owns_client:
+                await self.client.aclose()
+                self.client = None
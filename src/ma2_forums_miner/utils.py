@@ -5,9 +5,27 @@ This module provides helper functions for file operations and path management.
 """
 
 import hashlib
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
+
+# str.translate() deletion table for characters stripped from thread titles
+# when building folder names
+ILLEGAL_FOLDER_CHARS = str.maketrans('', '', '/\\:*?"<>|')
+
+# Runs of whitespace collapsed to a single space in folder names
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Chunk size for hashing files when hashlib.file_digest() is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Worker threads used to load metadata.json files in bulk. File reads
+# release the GIL, so overlapping them hides per-file open/read latency.
+MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def sha256_file(file_path: Union[str, Path]) -> str:
@@ -25,34 +43,41 @@ def sha256_file(file_path: Union[str, Path]) -> str:
         Example: "sha256:abc123def456..."
         
     How it works:
-        1. Create a SHA256 hash object
-        2. Read the file in 8KB chunks (efficient for both small and large files)
-        3. Update the hash with each chunk
+        1. Open the file in binary mode
+        2. On Python 3.11+, hand it to hashlib.file_digest(), which runs the
+           whole read-and-hash loop in C (releasing the GIL while it reads)
+        3. On older Pythons, read 1 MiB chunks into one reusable buffer with
+           readinto() and update the hash with each chunk
         4. Return the final hexadecimal digest with "sha256:" prefix
         
     Why chunks?
         Reading in chunks means we can hash files of any size without
-        running out of memory. An 8KB chunk size is a good balance between
-        I/O overhead and memory usage.
+        running out of memory. A 1 MiB buffer needs far fewer read()
+        syscalls than small chunks, and reusing it with readinto() avoids
+        allocating a new bytes object for every chunk.
     
     Example:
         checksum = sha256_file("/path/to/file.xml")
         # Returns: "sha256:e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
     """
-    # -------------------------------------------------------
-    # Create SHA256 hasher instance
-    # -------------------------------------------------------
-    sha256_hash = hashlib.sha256()
-    
-    # -------------------------------------------------------
-    # Read and hash the file in chunks
-    # -------------------------------------------------------
-    # Using 8192 bytes (8KB) as chunk size - this is a common default
-    # that balances memory usage with I/O efficiency
     with open(file_path, "rb") as f:
-        # Read file in chunks to handle large files efficiently
-        for byte_block in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(byte_block)
+        # -------------------------------------------------------
+        # Fast path: hashlib.file_digest() (Python 3.11+)
+        # -------------------------------------------------------
+        if hasattr(hashlib, "file_digest"):
+            sha256_hash = hashlib.file_digest(f, "sha256")
+        
+        # -------------------------------------------------------
+        # Fallback: hash the file in chunks via a reusable buffer
+        # -------------------------------------------------------
+        else:
+            sha256_hash = hashlib.sha256()
+            buffer = memoryview(bytearray(HASH_CHUNK_SIZE))
+            while True:
+                bytes_read = f.readinto(buffer)
+                if not bytes_read:
+                    break
+                sha256_hash.update(buffer[:bytes_read])
     
     # -------------------------------------------------------
     # Return formatted checksum
@@ -111,10 +136,10 @@ def safe_thread_folder(thread_id: str, title: str, max_length: int = 50) -> str:
     # - Multiple spaces: replace with single space for cleanliness
     
     # Remove illegal characters
-    clean_title = re.sub(r'[/\\:*?"<>|]', '', title)
+    clean_title = title.translate(ILLEGAL_FOLDER_CHARS)
     
     # Replace multiple spaces with single space
-    clean_title = re.sub(r'\s+', ' ', clean_title)
+    clean_title = WHITESPACE_RE.sub(' ', clean_title)
     
     # -------------------------------------------------------
     # STEP 2: Convert to slug format
@@ -139,3 +164,73 @@ def safe_thread_folder(thread_id: str, title: str, max_length: int = 50) -> str:
     folder_name = f"thread_{thread_id}_{slug}"
     
     return folder_name
+
+
+def load_thread_metadata(thread_dir: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Load the metadata.json written by the scraper for one thread.
+    
+    Args:
+        thread_dir: Path to a thread folder (e.g., "output/threads/thread_30890_...")
+        
+    Returns:
+        The parsed metadata dictionary, or None if the folder has no
+        metadata.json
+        
+    Why orjson and read_bytes()?
+        orjson parses considerably faster than the standard library's json
+        module and accepts bytes directly, so the file is read in binary
+        mode without a separate UTF-8 decode pass. Catching
+        FileNotFoundError instead of checking exists() first also saves a
+        stat() call per thread.
+    
+    Example:
+        metadata = load_thread_metadata("output/threads/thread_30890_Moving_Fixtures")
+        # Returns: {"thread_id": "30890", "title": "...", "posts": [...], ...}
+    """
+    metadata_file = Path(thread_dir) / "metadata.json"
+    try:
+        return orjson.loads(metadata_file.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def load_all_thread_metadata(
+    output_dir: Union[str, Path],
+    max_workers: int = MAX_LOAD_WORKERS
+) -> List[Tuple[Path, Dict[str, Any]]]:
+    """
+    Load the metadata.json of every thread folder in an output directory.
+    
+    Args:
+        output_dir: Directory containing the thread folders
+                    (e.g., "output/threads")
+        max_workers: Number of threads used to read files concurrently
+        
+    Returns:
+        List of (thread_dir, metadata) tuples sorted by folder path.
+        Folders without a metadata.json are skipped.
+        
+    How it works:
+        1. List thread folders with os.scandir() - each entry caches its
+           file type from the directory listing, so is_dir() needs no
+           extra stat() call (unlike Path.iterdir() + Path.is_dir())
+        2. Load every metadata.json through a thread pool so thousands of
+           small file reads overlap instead of running one after another
+        3. Pair each folder with its metadata, preserving sorted order
+    
+    Example:
+        for thread_dir, metadata in load_all_thread_metadata("output/threads"):
+            print(thread_dir.name, len(metadata.get("posts", [])))
+    """
+    with os.scandir(output_dir) as entries:
+        thread_dirs = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+    
+    # map() returns results in input order, so pairs stay sorted
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        all_metadata = executor.map(load_thread_metadata, thread_dirs)
+        return [
+            (thread_dir, metadata)
+            for thread_dir, metadata in zip(thread_dirs, all_metadata)
+            if metadata is not None
+        ]
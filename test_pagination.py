@@ -8,13 +8,20 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add scraper to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path to import the package
+sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-import httpx
+import lxml.html
 from bs4 import BeautifulSoup
 
-BOARD_URL = "https://forum.malighting.com/forum/board/35-grandma2-macro-share/"
+from ma2_forums_miner.scraper import BOARD_URL, create_client
+
+# XPath 1.0 has no lower-case(); translate() the letters we match on instead
+NEXT_CLASS_XPATH = "//a[contains(translate(@class, 'NEXT', 'next'), 'next')]"
+PAGE_CLASS_OR_ID_XPATH = (
+    "//*[contains(translate(@class, 'PAGE', 'page'), 'page')"
+    " or contains(translate(@id, 'PAGE', 'page'), 'page')]"
+)
 
 
 async def test_pagination():
@@ -24,7 +31,8 @@ async def test_pagination():
     print("Testing Forum Pagination Structure")
     print("=" * 80)
 
-    async with httpx.AsyncClient(http2=True, follow_redirects=True, timeout=30.0) as client:
+    # Same pooled HTTP/2 client configuration the scraper uses
+    async with create_client() as client:
         print(f"\n📥 Fetching: {BOARD_URL}")
         response = await client.get(BOARD_URL)
 
@@ -36,6 +44,10 @@ async def test_pagination():
 
         soup = BeautifulSoup(response.text, "lxml")
 
+        # Raw lxml tree for the attribute scans below - XPath filters run in
+        # libxml2 instead of calling a Python lambda for every tag
+        tree = lxml.html.fromstring(response.content)
+
         # Check pagination structure
         print("\n" + "=" * 80)
         print("Pagination Analysis")
@@ -62,14 +74,14 @@ async def test_pagination():
                 print(f"   - {text:20s} → {href}")
 
         # Method 3: Look for any links with /page/ in them
-        all_page_links = soup.find_all('a', href=lambda x: x and '/page/' in x)
+        all_page_links = tree.xpath('//a[contains(@href, "/page/")]')
         print(f"\n3. Found {len(all_page_links)} links containing '/page/'")
 
         if all_page_links:
             print("\n   All /page/ links:")
             for link in all_page_links[:15]:
                 href = link.get('href', '')
-                text = link.text.strip()
+                text = link.text_content().strip()
                 print(f"   - {text:20s} → {href}")
 
         # Method 4: Check thread list
@@ -100,12 +112,12 @@ async def test_pagination():
         print("Navigation Buttons")
         print("=" * 80)
 
-        next_buttons = soup.find_all('a', class_=lambda x: x and 'next' in x.lower() if x else False)
+        next_buttons = tree.xpath(NEXT_CLASS_XPATH)
         print(f"\n   Found {len(next_buttons)} 'next' buttons")
 
         for btn in next_buttons:
             print(f"   - Class: {btn.get('class')}")
-            print(f"     Text: {btn.text.strip()}")
+            print(f"     Text: {btn.text_content().strip()}")
             print(f"     Href: {btn.get('href')}")
 
         # Check for any element with "page" in class or id
@@ -113,17 +125,14 @@ async def test_pagination():
         print("Elements with 'page' in class/id")
         print("=" * 80)
 
-        page_elements = soup.find_all(lambda tag:
-            (tag.get('class') and any('page' in str(c).lower() for c in tag.get('class'))) or
-            (tag.get('id') and 'page' in str(tag.get('id')).lower())
-        )
+        page_elements = tree.xpath(PAGE_CLASS_OR_ID_XPATH)
         print(f"\n   Found {len(page_elements)} elements with 'page' in class/id")
 
         for elem in page_elements[:5]:
-            print(f"\n   Element: {elem.name}")
+            print(f"\n   Element: {elem.tag}")
             print(f"   Class: {elem.get('class')}")
             print(f"   ID: {elem.get('id')}")
-            if elem.name == 'a':
+            if elem.tag == 'a':
                 print(f"   Href: {elem.get('href')}")
 
 
@@ -5,8 +5,11 @@ Test to verify that ThreadMetadata properly serializes posts field to JSON.
 
 import json
 import sys
+from dataclasses import asdict
 from pathlib import Path
 
+import orjson
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -75,19 +78,28 @@ def test_posts_serialization():
     print(f"✅ 'posts' field exists in dictionary")
     print(f"   Contains {len(metadata_dict['posts'])} posts")
     
-    # Convert to JSON
+    # Convert to JSON (same orjson options the scraper uses for metadata.json)
     print(f"\n📄 Converting to JSON...")
     try:
-        json_str = json.dumps(metadata_dict, indent=2)
+        json_bytes = orjson.dumps(
+            metadata_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        )
         print(f"✅ JSON serialization successful")
-        print(f"   JSON size: {len(json_str)} characters")
+        print(f"   JSON size: {len(json_bytes)} bytes")
     except Exception as e:
         print(f"❌ FAIL: JSON serialization failed: {e}")
         return False
     
+    # orjson can also serialize the dataclasses directly - the content must
+    # match to_dict() (only key order differs, as OPT_SORT_KEYS applies to dicts)
+    if orjson.loads(orjson.dumps(metadata)) != metadata_dict:
+        print(f"❌ FAIL: Direct dataclass serialization differs from to_dict()")
+        return False
+    
     # Verify JSON structure
     print(f"\n🔍 Verifying JSON structure...")
-    parsed = json.loads(json_str)
+    parsed = orjson.loads(json_bytes)
     
     if 'posts' not in parsed:
         print(f"❌ FAIL: 'posts' field missing from JSON!")
@@ -129,6 +141,45 @@ def test_posts_serialization():
     return True
 
 
+def test_to_dict_matches_asdict():
+    """Test that to_dict() matches dataclasses.asdict() for a large thread."""
+    
+    print("=" * 80)
+    print("Testing to_dict() Against asdict() (10,000 posts)")
+    print("=" * 80)
+    
+    posts = [
+        Post(
+            author=f"user_{i % 50}",
+            post_date="2024-01-15T10:30:00Z" if i % 3 else None,
+            post_text=f"Post number {i}",
+            post_number=i
+        )
+        for i in range(1, 10001)
+    ]
+    assets = [
+        Asset(filename="macro.xml", url="https://forum.example.com/attachment/1/",
+              size=2048, download_count=15, checksum="sha256:abc123", post_number=1),
+        Asset(filename="show.gz", url="https://forum.example.com/attachment/2/"),
+    ]
+    metadata = ThreadMetadata(
+        thread_id="12345",
+        title="Large thread",
+        url="https://forum.example.com/thread/12345",
+        author="user_1",
+        posts=posts,
+        replies=len(posts) - 1,
+        assets=assets
+    )
+    
+    if metadata.to_dict() != asdict(metadata):
+        print(f"\n❌ FAIL: to_dict() differs from asdict()")
+        return False
+    
+    print(f"\n✅ PASS: to_dict() matches asdict() for {len(posts)} posts")
+    return True
+
+
 if __name__ == "__main__":
-    success = test_posts_serialization()
+    success = test_posts_serialization() and test_to_dict_matches_asdict()
     sys.exit(0 if success else 1)
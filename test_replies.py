@@ -5,13 +5,14 @@ Test script to verify that replies/posts are being captured correctly.
 
 import asyncio
 import sys
-import json
 from pathlib import Path
 
+import orjson
+
 # Add src to path to import the package
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from ma2_forums_miner.scraper import ForumScraper
+from ma2_forums_miner.scraper import ForumScraper, create_client
 
 
 async def test_thread_with_replies():
@@ -21,30 +22,15 @@ async def test_thread_with_replies():
     print("Testing Thread Scraping - Verifying Post/Reply Capture")
     print("=" * 80)
 
-    # Initialize scraper
-    scraper = ForumScraper()
-    
-    # Initialize HTTP client (normally done in run() method)
-    import httpx
-    scraper.client = httpx.AsyncClient(
-        http2=True,
-        timeout=30.0,
-        follow_redirects=True,
-        headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-    )
-
     # Test with thread 20248 which is known to exist
     thread_url = "https://forum.malighting.com/forum/thread/20248-abort-out-of-macro/"
 
     print(f"\n📥 Scraping: {thread_url}")
-    
-    try:
+
+    # Share one pooled HTTP/2 client with the scraper (normally created in run())
+    async with create_client() as client:
+        scraper = ForumScraper(client=client)
         metadata = await scraper.fetch_thread(thread_url)
-    finally:
-        # Close the client
-        await scraper.client.aclose()
 
     if not metadata:
         print("❌ Failed to scrape thread")
@@ -78,9 +64,12 @@ async def test_thread_with_replies():
     print(f"\n🔍 Testing JSON serialization...")
     try:
         metadata_dict = metadata.to_dict()
-        json_str = json.dumps(metadata_dict, indent=2)
+        json_bytes = orjson.dumps(
+            metadata_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        )
         print(f"✅ Successfully serialized to JSON")
-        print(f"   JSON size: {len(json_str)} characters")
+        print(f"   JSON size: {len(json_bytes)} bytes")
         
         # Check if posts field exists in dict
         if 'posts' in metadata_dict:
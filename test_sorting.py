@@ -3,13 +3,14 @@
 Test to verify thread sorting logic works correctly.
 """
 
+import random
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from ma2_forums_miner.scraper import ThreadInfo
+from ma2_forums_miner.scraper import ThreadInfo, sort_threads_by_date
 
 
 def test_thread_sorting():
@@ -32,8 +33,8 @@ def test_thread_sorting():
     for i, t in enumerate(threads, 1):
         print(f"   {i}. {t.url.split('/')[-1]} - {t.date or 'No date'}")
     
-    # Sort by date (same logic as in scraper.py)
-    threads.sort(key=lambda t: t.date if t.date else "9999-99-99")
+    # Sort by date (same function the scraper uses)
+    threads = sort_threads_by_date(threads)
     
     print(f"\n✅ After sorting (oldest first, None at end):")
     for i, t in enumerate(threads, 1):
@@ -61,6 +62,34 @@ def test_thread_sorting():
         return False
 
 
+def test_thread_sorting_matches_sentinel_sort():
+    """Test that sorting many threads matches the "9999-99-99" sentinel sort."""
+    
+    print("=" * 80)
+    print("Testing Thread Sorting Against Sentinel Sort (10,000 threads)")
+    print("=" * 80)
+    
+    rng = random.Random(42)
+    threads = []
+    for i in range(10000):
+        if rng.random() < 0.1:
+            date = None  # ~10% of threads without a date
+        else:
+            # Small date range so many threads share the same date (tests stability)
+            date = f"20{rng.randint(10, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z"
+        threads.append(ThreadInfo(url=f"https://example.com/thread/{i}", date=date))
+    
+    expected = sorted(threads, key=lambda t: t.date if t.date else "9999-99-99")
+    actual = sort_threads_by_date(threads)
+    
+    if [t.url for t in actual] == [t.url for t in expected]:
+        print(f"\n✅ PASS: {len(actual)} threads sorted identically (including ties)")
+        return True
+    else:
+        print(f"\n❌ FAIL: Sort order differs from sentinel sort")
+        return False
+
+
 if __name__ == "__main__":
-    success = test_thread_sorting()
+    success = test_thread_sorting() and test_thread_sorting_matches_sentinel_sort()
     sys.exit(0 if success else 1)
@@ -11,7 +11,7 @@ from pathlib import Path
 # Add src to path to import the package
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from ma2_forums_miner.scraper import ForumScraper
+from ma2_forums_miner.scraper import ForumScraper, create_client
 
 
 async def test_thread_20248():
@@ -21,15 +21,22 @@ async def test_thread_20248():
     print("Testing Thread 20248 - Known to have CopyIfoutput.xml attachment")
     print("=" * 80)
 
-    # Initialize scraper
-    scraper = ForumScraper()
+    # One pooled HTTP/2 client for the page fetch and all downloads
+    # (normally created in run())
+    async with create_client() as client:
+        scraper = ForumScraper(client=client)
+        return await check_thread_20248(scraper)
+
+
+async def check_thread_20248(scraper: ForumScraper) -> bool:
+    """Fetch thread 20248 and download its attachments using the given scraper."""
 
     # Thread URL
     thread_url = "https://forum.malighting.com/forum/thread/20248-abort-out-of-macro/"
 
     # Scrape just this one thread
     print(f"\n📥 Scraping: {thread_url}")
-    metadata = await scraper.scrape_thread(thread_url)
+    metadata = await scraper.fetch_thread(thread_url)
 
     if not metadata:
         print("❌ Failed to scrape thread")
@@ -47,21 +54,24 @@ async def test_thread_20248():
             print(f"     URL: {asset.url}")
             print(f"     Downloads: {asset.download_count}")
 
-        # Try to download the first attachment
-        if metadata.assets:
-            print(f"\n📥 Testing download of: {metadata.assets[0].filename}")
-            output_dir = Path("output/test_thread_20248")
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            success = await scraper.download_asset(metadata.assets[0], output_dir)
+        # Download all attachments concurrently, the same way process_thread()
+        # does - download_asset() holds the scraper's semaphore, which bounds
+        # how many downloads are in flight at once
+        print(f"\n📥 Testing download of {len(metadata.assets)} attachments")
+        output_dir = Path("output/test_thread_20248")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        results = await asyncio.gather(
+            *[scraper.download_asset(asset, output_dir) for asset in metadata.assets]
+        )
+        for asset, success in zip(metadata.assets, results):
             if success:
-                print(f"✅ Successfully downloaded to: {output_dir / metadata.assets[0].filename}")
-                print(f"   Size: {metadata.assets[0].size} bytes")
-                print(f"   SHA256: {metadata.assets[0].checksum}")
-                return True
+                print(f"✅ Successfully downloaded to: {output_dir / asset.filename}")
+                print(f"   Size: {asset.size} bytes")
+                print(f"   SHA256: {asset.checksum}")
             else:
-                print(f"❌ Failed to download attachment")
-                return False
+                print(f"❌ Failed to download {asset.filename}")
+        return all(results)
     else:
         print("\n❌ NO ATTACHMENTS FOUND")
         print("   This means our CSS selectors are not matching the HTML!")